@@ -3,98 +3,397 @@
 # Searches DDG HTML endpoint, fetches pages, filters by topic/year/country/worldwide,
 # de-dupes, scores, and outputs JSON/CSV.
 
-import re, os, csv, json, time, random, hashlib
-from typing import List, Dict, Any, Optional
+import re, os, csv, time, random, hashlib, string, asyncio, sqlite3, html as htmllib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import date
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlencode, quote_plus, urljoin
+import aiohttp
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
+from urllib.parse import urlencode, quote_plus, urljoin, urlsplit, urlunsplit, parse_qsl
 from dateutil import parser as dateparser
 import tldextract
+import ahocorasick
 
 UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0 Safari/537.36"
 HEADERS = {"User-Agent": UA}
 DDG_HTML = "https://html.duckduckgo.com/html/"
+FETCH_CONCURRENCY = 64  # in-flight page fetches
+FETCH_PER_HOST = 4      # in-flight page fetches per host
+POLITE_DELAY = 0.7  # min seconds between hits on the same site
+MAX_PER_HOST = 4    # max pages fetched per registered domain per crawl
+MAX_BYTES = 2 * 1024 * 1024  # page bodies are truncated past this size
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "topic_crawler", "pages.sqlite3")
+CACHE_TTL = 7 * 86400       # seconds a cached page is served without asking the site
+CACHE_MAX_AGE = 30 * 86400  # entries not refreshed for this long are dropped
+
+# Never fetched; a host is blocked if it or any parent domain is listed
+# (what is left on duckduckgo.com after unwrapping /l/ redirects is ads)
+BLOCKED_DOMAINS = {"duckduckgo.com"}
+SIMHASH_MAX_DIST = 3  # pages whose text simhashes differ in <= this many bits are duplicates
+_TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_eid", "mc_cid", "igshid", "ref_src"}
+
+# Shared session for the (sequential) DDG search requests; page fetches go
+# through an aiohttp session, see fetch_all()
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
 
 # ---------------- Utilities ----------------
 
-def jhash(s: str) -> str:
-    return hashlib.sha1(s.encode("utf-8", errors="ignore")).hexdigest()
+def jhash(s: str) -> int:
+    # In-process set key only, so the built-in (SipHash) str hash is enough;
+    # not stable across runs (PYTHONHASHSEED).
+    return hash(s)
+
+def unwrap_url(url: str) -> str:
+    """
+    The URL a search result actually points at: DDG /l/?uddg= redirect links
+    are replaced by their target and scheme-relative links get https.
+    Raises ValueError for URLs urlsplit can't parse (e.g. a broken IPv6 host).
+    """
+    url = url.strip()
+    if url.startswith("//"):
+        url = "https:" + url
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if (host == "duckduckgo.com" or host.endswith(".duckduckgo.com")) and parts.path == "/l/":
+        target = dict(parse_qsl(parts.query)).get("uddg")
+        if target:
+            return unwrap_url(target)
+    return url
+
+def canon(url: str) -> str:
+    """
+    Canonical form of a URL for de-duping: https, lower-case host, no default
+    port, no fragment, sorted query minus tracking params, no trailing slash.
+    Applied to unwrap_url(url), so DDG redirect links key as their target.
+    An unparseable URL is its own key.
+    """
+    try:
+        parts = urlsplit(unwrap_url(url))
+    except ValueError:
+        return url.strip()
+    host = (parts.hostname or "").lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port in (None, 80, 443) else f"{host}:{port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    return urlunsplit(("https", netloc, parts.path.rstrip("/"), urlencode(query), ""))
+
+def simhash64(tokens: List[str]) -> int:
+    # Count-weighted 64-bit SimHash: near-identical texts get hashes that
+    # differ in only a few bits.
+    v = [0] * 64
+    for tok, w in Counter(tokens).items():
+        h = int.from_bytes(hashlib.blake2b(tok.encode("utf-8"), digest_size=8).digest(), "big")
+        for i in range(64):
+            v[i] += w if (h >> i) & 1 else -w
+    return sum(1 << i for i in range(64) if v[i] > 0)
+
+# One shared extractor using the bundled public suffix list snapshot, so it
+# never goes to the network
+_TLD = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+@lru_cache(maxsize=4096)
+def host_parts(host: str) -> Tuple[str, str, str]:
+    """(domain, suffix, registered domain) of a host name; memoised per host."""
+    e = _TLD(host)
+    reg = f"{e.domain}.{e.suffix}" if e.domain and e.suffix else ""
+    return (e.domain, e.suffix, reg)
+
+def url_host(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+def is_blocked(host: str) -> bool:
+    labels = host.lower().split(".")
+    return any(".".join(labels[i:]) in BLOCKED_DOMAINS for i in range(len(labels)))
+
+def squash_ws(text: str) -> str:
+    # Same as re.sub(r"\s+", " ", text).strip(), but str.split() does it in
+    # one C loop without the regex engine
+    return " ".join(text.split())
+
+# boilerplate tags plus likely noisy elements
+_NOISE_SELECTORS = (
+    "script", "style", "noscript", "header", "footer", "nav", "aside", "form",
+    "[aria-hidden='true']", ".sr-only", ".visually-hidden",
+)
+
+def _bs4(html: str):
+    # Slow pure-Python fallback, only imported if selectolax chokes on a page
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, "html.parser")
 
 def clean_text(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
-    for t in soup(["script", "style", "noscript", "header", "footer", "nav", "aside", "form"]):
-        t.decompose()
-    # drop likely noisy elements
-    for t in soup.select("[aria-hidden='true'], .sr-only, .visually-hidden"):
-        t.decompose()
-    text = soup.get_text(" ", strip=True)
-    text = re.sub(r"\s+", " ", text)
-    return text
+    try:
+        tree = HTMLParser(html)
+        for sel in _NOISE_SELECTORS:
+            for n in tree.css(sel):
+                n.decompose()
+        root = tree.body or tree.root
+        text = root.text(separator=" ", strip=True) if root else ""
+    except Exception:
+        soup = _bs4(html)
+        for t in soup.select(", ".join(_NOISE_SELECTORS)):
+            t.decompose()
+        text = soup.get_text(" ", strip=True)
+    return squash_ws(text)
 
 YEAR_RE = re.compile(r"\b(20\d{2})\b")
+_DATE_RE = re.compile(
+    r"\b(?:\d{1,2}\s+[A-Za-z]{3,9}\s+20\d{2}|20\d{2}-\d{1,2}-\d{1,2}|20\d{2}/\d{1,2}/\d{1,2}|[A-Za-z]{3,9}\s+\d{1,2},\s*20\d{2})\b"
+)
+_SENT_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_TOKEN_RE = re.compile(r"[A-Za-z0-9\-]+")
+_YEAR_SPEC_RE = re.compile(r"^(20\d{2})(?:\s*-\s*(20\d{2}))?$")
+
+COUNTRY_SYNONYMS = {
+    "united kingdom": ["uk", "u.k.", "britain", "british", "england", "scotland", "wales", "northern ireland"],
+    "united states": ["usa", "u.s.", "america", "american", "us"],
+    "uae": ["united arab emirates", "emirati", "dubai", "abu dhabi"],
+    "india": ["indian", "bharat"],
+    "europe": ["eu", "european union"],
+}
 
 def extract_years(text: str):
     return sorted({int(y) for y in YEAR_RE.findall(text)})
 
-def guess_published(text: str) -> Optional[str]:
-    # Heuristics: look for typical date patterns and pick the newest parseable
-    candidates = re.findall(
-        r"\b(?:\d{1,2}\s+[A-Za-z]{3,9}\s+20\d{2}|20\d{2}-\d{1,2}-\d{1,2}|20\d{2}/\d{1,2}/\d{1,2}|[A-Za-z]{3,9}\s+\d{1,2},\s*20\d{2})\b",
-        text,
-    )
-    dates = []
-    for c in candidates:
+_MONTH_NAMES = ["january", "february", "march", "april", "may", "june",
+                "july", "august", "september", "october", "november", "december"]
+MONTHS = {m: i for i, m in enumerate(_MONTH_NAMES, 1)}
+MONTHS.update({m[:3]: i for i, m in enumerate(_MONTH_NAMES, 1)})
+MONTHS["sept"] = 9
+
+# One pattern per _DATE_RE shape
+_YMD = re.compile(r"(?P<y>20\d{2})([-/])(?P<mo>\d{1,2})\2(?P<d>\d{1,2})")
+_DMY = re.compile(r"(?P<d>\d{1,2})\s+(?P<mo>[A-Za-z]{3,9})\s+(?P<y>20\d{2})")
+_MDY = re.compile(r"(?P<mo>[A-Za-z]{3,9})\s+(?P<d>\d{1,2}),\s*(?P<y>20\d{2})")
+SLOW_DATE_LIMIT = 50  # pages with more candidates than this skip the dateutil fallback
+
+def _parse_fast(c: str) -> Optional[date]:
+    """Parses the _DATE_RE shapes directly; None if c isn't one (or isn't a real date)."""
+    try:
+        if m := _YMD.fullmatch(c):
+            return date(int(m["y"]), int(m["mo"]), int(m["d"]))
+        m = _DMY.fullmatch(c) or _MDY.fullmatch(c)
+        if m and (mo := MONTHS.get(m["mo"].lower())):
+            return date(int(m["y"]), mo, int(m["d"]))
+    except ValueError:
+        pass
+    return None
+
+@lru_cache(maxsize=1 << 17)
+def _parse_slow(c: str) -> Optional[date]:
+    # dateutil, for whatever _parse_fast can't handle. Same date strings
+    # recur across pages; strict parse first, fuzzy only if that fails.
+    for fuzzy in (False, True):
         try:
-            dt = dateparser.parse(c, dayfirst=True, fuzzy=True)
-            dates.append(dt)
+            return dateparser.parse(c, dayfirst=True, fuzzy=fuzzy).date()
         except Exception:
             pass
-    if dates:
-        return max(dates).date().isoformat()
     return None
 
-def find_country_hits(text: str, country: Optional[str]):
+def guess_published(text: str) -> Optional[str]:
+    # Heuristics: look for typical date patterns and pick the newest parseable.
+    # Candidates are grouped by year and tried newest year first, so older
+    # years are never parsed once a newer one yields a date.
+    candidates = _DATE_RE.findall(text)
+    slow_ok = len(candidates) < SLOW_DATE_LIMIT
+    by_year: Dict[int, set] = {}
+    for c in candidates:
+        by_year.setdefault(int(YEAR_RE.search(c).group(1)), set()).add(c)
+    for y in sorted(by_year, reverse=True):
+        parsed = (_parse_fast(c) or (_parse_slow(c) if slow_ok else None) for c in by_year[y])
+        dates = [d for d in parsed if d]
+        if dates:
+            return max(dates).isoformat()
+    return None
+
+def country_keys(country: Optional[str]) -> List[str]:
     if not country or country.lower() == "worldwide":
         return []
     c = country.lower()
-    synonyms = {
-        "united kingdom": ["uk", "u.k.", "britain", "british", "england", "scotland", "wales", "northern ireland"],
-        "united states": ["usa", "u.s.", "america", "american", "us"],
-        "uae": ["united arab emirates", "emirati", "dubai", "abu dhabi"],
-        "india": ["indian", "bharat"],
-        "europe": ["eu", "european union"],
-    }
-    keys = [c] + synonyms.get(c, [])
-    tl = text.lower()
-    hits = []
-    for k in keys:
-        if re.search(rf"\b{re.escape(k)}\b", tl):
-            hits.append(k)
-    return sorted(set(hits))
+    return [c] + COUNTRY_SYNONYMS.get(c, [])
+
+_WORDCHAR = frozenset(string.ascii_lowercase + string.digits + "_")
+
+def term_automaton(terms: List[str]) -> Optional[ahocorasick.Automaton]:
+    # Aho-Corasick over all terms: a page is scanned once regardless of how
+    # many terms there are. Match against lower-cased text.
+    uniq = {t.lower() for t in terms if t}
+    if not uniq:
+        return None
+    A = ahocorasick.Automaton()
+    for t in uniq:
+        A.add_word(t, t)
+    A.make_automaton()
+    return A
+
+def term_hits(tl: str, A: Optional[ahocorasick.Automaton]) -> List[str]:
+    """Distinct whole-word terms of automaton A found in lower-cased text tl."""
+    if A is None:
+        return []
+    hits = set()
+    n = len(tl)
+    for end, term in A.iter(tl):
+        start = end - len(term) + 1
+        if start > 0 and tl[start - 1] in _WORDCHAR:
+            continue
+        if end + 1 < n and tl[end + 1] in _WORDCHAR:
+            continue
+        hits.add(term)
+    return sorted(hits)
+
+PREFIX_MIN = 4  # topic terms at least this long also match as word prefixes
+_END = None     # trie key marking the end of a term; never a text character
+
+TermTrie = Tuple[Dict[Any, Any], "re.Pattern[str]"]
+
+def term_trie(terms: List[str]) -> Optional[TermTrie]:
+    """
+    Nested-dict trie of lower-cased terms (the _END key holds the full term),
+    plus a compiled pattern for the word starts worth walking it from.
+    """
+    root: Dict[Any, Any] = {}
+    for t in {t.lower() for t in terms if t}:
+        node = root
+        for ch in t:
+            node = node.setdefault(ch, {})
+        node[_END] = t
+    if not root:
+        return None
+    # only word starts whose first char begins some term
+    starts = re.compile(r"(?<![a-z0-9_])[" + re.escape("".join(root)) + "]")
+    return root, starts
+
+def trie_hits(tl: str, trie: Optional[TermTrie]) -> List[str]:
+    """
+    Distinct terms of the trie found at word starts in lower-cased text tl.
+    Terms of PREFIX_MIN+ chars match as prefixes ("ransom" hits
+    "ransomware"); shorter ones only as whole words.
+
+    >>> trie_hits("the us$5 million", term_trie(["us"]))
+    ['us']
+    >>> trie_hits("paid in ransomware$ and ransom$", term_trie(["ransomware", "ransom"]))
+    ['ransom', 'ransomware']
+    """
+    if trie is None:
+        return []
+    root, starts = trie
+    hits = set()
+    n = len(tl)
+    for m in starts.finditer(tl):
+        node, k = root, m.start()
+        while k < n and tl[k] in node:
+            node = node[tl[k]]
+            k += 1
+            term = node.get(_END)
+            if term and (len(term) >= PREFIX_MIN or k == n or tl[k] not in _WORDCHAR):
+                hits.add(term)
+    return sorted(hits)
+
+def iter_sentences(text: str):
+    # Lazy equivalent of _SENT_SPLIT.split(text): callers that stop early
+    # never scan the rest of the page.
+    pos = 0
+    for m in _SENT_SPLIT.finditer(text):
+        yield text[pos:m.start()]
+        pos = m.end()
+    yield text[pos:]
 
 def summarize_lead(text: str, max_chars=450):
-    sents = re.split(r"(?<=[.!?])\s+", text)
     out = []
-    for s in sents:
-        if len(" ".join(out)) >= max_chars:
+    total = 0  # len(" ".join(out)), kept as a running count
+    for s in iter_sentences(text):
+        if total >= max_chars:
             break
+        total += len(s) + (1 if out else 0)
         out.append(s)
     return " ".join(out)[:max_chars].strip()
 
 # ---------------- Search (DuckDuckGo HTML) ----------------
 
-def ddg_search(query: str, max_results: int = 20, wait_between=1.0) -> List[Dict[str, str]]:
+# DDG's no-JS results template is stable, so results are pulled straight out
+# of the response bytes: one result anchor plus whatever follows it up to the
+# next result anchor (where the snippet lives).
+_DDG_RESULT = re.compile(
+    rb'<a\b([^>]*\bclass="result__a"[^>]*)>(.*?)</a>(.*?)(?=<a\b[^>]*\bclass="result__a"|\Z)', re.S
+)
+_DDG_HREF = re.compile(rb'\bhref="([^"]+)"')
+_DDG_SNIPPET = re.compile(rb'class="result__snippet"[^>]*>(.*?)</(?:a|div)>', re.S)
+_DDG_NEXT_S = re.compile(rb'<input[^>]*\bname="s"[^>]*\bvalue="(\d*)"')
+_TAG_RE = re.compile(rb"<[^>]+>")
+
+def _markup_text(b: bytes, sep: bytes) -> str:
+    text = htmllib.unescape(_TAG_RE.sub(sep, b).decode("utf-8", errors="replace"))
+    return squash_ws(text)
+
+def parse_page_bytes(body: bytes):
+    """Yields {title, url, snippet} for each result on a raw DDG results page."""
+    for m in _DDG_RESULT.finditer(body):
+        href = _DDG_HREF.search(m.group(1))
+        if not href:
+            continue
+        snip = _DDG_SNIPPET.search(m.group(3))
+        yield {
+            "title": _markup_text(m.group(2), b""),
+            "url": htmllib.unescape(href.group(1).decode("utf-8", errors="replace")),
+            "snippet": _markup_text(snip.group(1), b" ") if snip else "",
+        }
+
+def parse_results(body: bytes, results: List[Dict[str, str]]) -> Optional[int]:
     """
-    Uses DDG HTML endpoint (no JS) via POST.
-    Returns: list of {title, url, snippet}
+    Appends {title, url, snippet} for each result on a DDG results page.
+    Returns the pagination offset from the "Next" form, or None if absent.
+    Falls back to a full DOM parse if the template regex finds nothing.
     """
-    results = []
-    # First page
-    r = requests.post(DDG_HTML, headers=HEADERS, data={"q": query}, timeout=20)
-    r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+    found = [r for r in parse_page_bytes(body) if r["title"] and r["url"]]
+    if not found:
+        return parse_page(body.decode("utf-8", errors="replace"), results)
+    results.extend(found)
+    m = _DDG_NEXT_S.search(body)
+    if m and b'id="links_form"' in body:
+        return int(m.group(1) or "0")
+    return None
 
-    def parse_page(soup):
+def parse_page(html: str, results: List[Dict[str, str]]) -> Optional[int]:
+    """
+    DOM-based parse_results, for when DDG's markup doesn't match the regex.
+    """
+    found = []
+    try:
+        tree = HTMLParser(html)
+        for box in tree.css("div.result__body"):
+            a = box.css_first("a.result__a")
+            if not a:
+                continue
+            title = a.text(strip=True)
+            href = a.attributes.get("href")
+            snippet_el = box.css_first("a.result__snippet, div.result__snippet")
+            snippet = snippet_el.text(separator=" ", strip=True) if snippet_el else ""
+            if title and href:
+                found.append({"title": title, "url": href, "snippet": snippet})
+        next_form = tree.css_first("form#links_form")
+        s_param = tree.css_first("input[name='s']")
+        s_value = s_param.attributes.get("value") if s_param else None
+    except Exception:
+        found = []
+        soup = _bs4(html)
         for box in soup.select("div.result__body"):
             a = box.select_one("a.result__a")
             if not a:
@@ -104,26 +403,38 @@ def ddg_search(query: str, max_results: int = 20, wait_between=1.0) -> List[Dict
             snippet_el = box.select_one("a.result__snippet, div.result__snippet")
             snippet = snippet_el.get_text(" ", strip=True) if snippet_el else ""
             if title and href:
-                results.append({"title": title, "url": href, "snippet": snippet})
+                found.append({"title": title, "url": href, "snippet": snippet})
+        next_form = soup.find("form", {"id": "links_form"})
+        s_param = soup.find("input", {"name": "s"})
+        s_value = s_param.get("value") if s_param else None
+    results.extend(found)
+    if s_param and next_form:
+        return int(s_value or "0")
+    return None
 
-    parse_page(soup)
+def ddg_search(query: str, max_results: int = 20, wait_between=1.0) -> List[Dict[str, str]]:
+    """
+    Uses DDG HTML endpoint (no JS) via POST.
+    Returns: list of {title, url, snippet}
+    """
+    results = []
+    # First page
+    r = SESSION.post(DDG_HTML, data={"q": query}, timeout=20)
+    r.raise_for_status()
+    start = parse_results(r.content, results)
 
     # Pagination support (optional; DDG has "Next" form)
-    next_form = soup.find("form", {"id": "links_form"})
-    s_param = soup.find("input", {"name": "s"})
-    if s_param and next_form:
-        start = int(s_param.get("value", "0"))
+    if start is not None:
         # Pull subsequent pages until max_results
         while len(results) < max_results:
             start += 30  # DDG increments by ~30
             payload = {"q": query, "s": str(start)}
             time.sleep(wait_between + random.random() * 0.6)
-            r = requests.post(DDG_HTML, headers=HEADERS, data=payload, timeout=20)
+            r = SESSION.post(DDG_HTML, data=payload, timeout=20)
             if r.status_code != 200:
                 break
-            soup = BeautifulSoup(r.text, "html.parser")
             before = len(results)
-            parse_page(soup)
+            parse_results(r.content, results)
             if len(results) == before:
                 break  # no more new results
 
@@ -131,37 +442,215 @@ def ddg_search(query: str, max_results: int = 20, wait_between=1.0) -> List[Dict
 
 # ---------------- Fetch & Filter ----------------
 
-def fetch_html(url: str, timeout=20) -> Optional[str]:
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.I)
+
+def decode_body(buf: bytes, ctype: str) -> str:
+    # header charset, then <meta charset>, then utf-8
+    m = _CHARSET_RE.search(ctype) or _META_CHARSET_RE.search(buf, 0, 4096)
+    enc = m.group(1) if m else "utf-8"
+    if isinstance(enc, bytes):
+        enc = enc.decode("ascii")
     try:
-        r = requests.get(url, headers=HEADERS, timeout=timeout, allow_redirects=True)
-        ctype = r.headers.get("content-type", "")
-        if r.status_code == 200 and "text/html" in ctype:
-            return r.text
+        return buf.decode(enc, errors="replace")
+    except LookupError:
+        return buf.decode("utf-8", errors="replace")
+
+_host_next: Dict[str, float] = {}
+
+async def polite_wait(url: str):
+    # Per-site spacing: fetches stay parallel across sites but are spread out
+    # within one registered domain (or one host, for IPs / intranet names -
+    # the same key as the per-site cap).
+    host = url_host(url)
+    host = host_parts(host)[2] or host
+    now = time.monotonic()
+    slot = max(now, _host_next.get(host, 0.0))
+    _host_next[host] = slot + POLITE_DELAY + random.random() * 0.4
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+class PageCache:
+    """
+    SQLite cache of fetched HTML, keyed by canonical URL, persisted between
+    runs. ETag / Last-Modified are kept so stale pages can be revalidated
+    with a conditional GET instead of re-downloaded.
+    """
+
+    def __init__(self, path: str = CACHE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS pages "
+            "(key TEXT PRIMARY KEY, body TEXT, etag TEXT, last_modified TEXT, fetched REAL)"
+        )
+        self.db.execute("DELETE FROM pages WHERE fetched < ?", (time.time() - CACHE_MAX_AGE,))
+        self.db.commit()
+
+    def get(self, key: str) -> Optional[Tuple[str, Optional[str], Optional[str], float]]:
+        """(body, etag, last_modified, fetched) or None"""
+        return self.db.execute(
+            "SELECT body, etag, last_modified, fetched FROM pages WHERE key = ?", (key,)
+        ).fetchone()
+
+    def put(self, key: str, body: str, etag: Optional[str], last_modified: Optional[str]):
+        self.db.execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+            (key, body, etag, last_modified, time.time()),
+        )
+        self.db.commit()
+
+    def touch(self, key: str):
+        self.db.execute("UPDATE pages SET fetched = ? WHERE key = ?", (time.time(), key))
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+async def fetch_html(session: aiohttp.ClientSession, url: str, cache: Optional[PageCache] = None, timeout=20) -> Optional[str]:
+    # Streamed so that at most MAX_BYTES of a page is ever held in memory.
+    # Fresh cache hits skip the network; stale ones are revalidated. Cache
+    # errors (e.g. another crawl holding the lock) only cost the cache.
+    key = canon(url)
+    hit = None
+    if cache:
+        try:
+            hit = cache.get(key)
+        except sqlite3.Error:
+            pass
+    headers = {}
+    if hit:
+        body, etag, last_modified, fetched = hit
+        if time.time() - fetched < CACHE_TTL:
+            return body
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    await polite_wait(url)
+    try:
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout), allow_redirects=True) as r:
+            if r.status == 304 and hit:
+                try:
+                    cache.touch(key)
+                except sqlite3.Error:
+                    pass
+                return hit[0]
+            ctype = r.headers.get("content-type", "")
+            if r.status != 200 or "text/html" not in ctype:
+                return None
+            buf = bytearray()
+            async for chunk in r.content.iter_chunked(65536):
+                buf.extend(chunk)
+                if len(buf) >= MAX_BYTES:
+                    del buf[MAX_BYTES:]
+                    break
+            etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+        body = decode_body(buf, ctype)
     except Exception:
-        return None
-    return None
+        # a stale copy beats nothing if the site is unreachable
+        return hit[0] if hit else None
+    if cache:
+        try:
+            cache.put(key, body, etag, last_modified)
+        except sqlite3.Error:
+            pass
+    return body
+
+async def fetch_all(urls: List[str], cache: Optional[PageCache] = None) -> List[Optional[str]]:
+    """Fetches all urls concurrently on one event loop; results are in input order."""
+    conn = aiohttp.TCPConnector(limit=FETCH_CONCURRENCY, limit_per_host=FETCH_PER_HOST, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=conn, headers=HEADERS) as session:
+        return await asyncio.gather(*(fetch_html(session, u, cache) for u in urls))
+
+@dataclass
+class PageFacts:
+    length: int
+    topic_hits: List[str]
+    country_hits: List[str]
+    years: List[int]
+    # filled in by finish_page, only for pages that pass MIN_SCORE
+    pub_date: Optional[str] = None
+    lead: str = ""
+    simhash: int = 0
+
+def analyze_page(text: str, topic_trie: Optional[TermTrie], country_ac: Optional[ahocorasick.Automaton]) -> PageFacts:
+    """
+    The facts needed to score a page, gathered in one place so the text is
+    lower-cased once and each scan runs once.
+    """
+    tl = text.lower()
+    return PageFacts(
+        length=len(text),
+        topic_hits=trie_hits(tl, topic_trie),
+        country_hits=term_hits(tl, country_ac),
+        years=extract_years(text),
+    )
 
-def relevance_score(text: str, topic_terms: List[str], years: Optional[List[int]], country: Optional[str]) -> float:
-    t = text.lower()
-    score = 0.0
-    # topic keyword hits
-    for term in topic_terms:
-        if re.search(rf"\b{re.escape(term.lower())}\b", t):
-            score += 1.0
-    # year hits
-    if years:
-        ys = extract_years(text)
-        inter = set(ys).intersection(set(years))
-        score += 0.6 * len(inter)
-    # country hits
-    ch = find_country_hits(text, country)
-    score += 0.8 * len(ch)
-    # content length bonus
-    if len(text) > 2000:
-        score += 0.5
-    return score
-
-def crawl_topic_ddg(topic: str, year: str = "any", country: str = "worldwide", max_urls: int = 25, market_hint: str = "en-GB") -> List[Dict[str, Any]]:
+def finish_page(facts: PageFacts, text: str, lead_chars: int = 400) -> PageFacts:
+    # The costlier facts (date parsing, lead, simhash), computed only once a
+    # page has cleared MIN_SCORE
+    facts.pub_date = guess_published(text)
+    facts.lead = summarize_lead(text, lead_chars)
+    facts.simhash = simhash64(_TOKEN_RE.findall(text.lower()))
+    return facts
+
+# Per-process matchers for parse workers, built once by _init_worker
+_worker_topic_trie: Optional[TermTrie] = None
+_worker_country_ac: Optional[ahocorasick.Automaton] = None
+
+def _init_worker(topic_terms: List[str], country_terms: List[str]):
+    global _worker_topic_trie, _worker_country_ac
+    _worker_topic_trie = term_trie(topic_terms)
+    _worker_country_ac = term_automaton(country_terms)
+
+def _worker(html: str) -> Optional[Tuple[PageFacts, str]]:
+    # HTML -> text -> scoring facts, run in a worker process (parsing holds
+    # the GIL). The text comes back so accepted pages can be finished.
+    text = clean_text(html)
+    if len(text) < 300:
+        return None
+    return analyze_page(text, _worker_topic_trie, _worker_country_ac), text
+
+# weight per distinct topic term, per wanted year found, per country term
+SCORE_WEIGHTS = (1.0, 0.6, 0.8)
+LONG_PAGE, LONG_PAGE_BONUS = 2000, 0.5
+MIN_SCORE = 1.0
+
+def page_features(facts: PageFacts, years: Optional[List[int]]) -> Tuple[int, int, int, int]:
+    """(topic hits, wanted years found, country hits, text length)"""
+    year_hits = len(set(facts.years).intersection(years)) if years else 0
+    return (len(facts.topic_hits), year_hits, len(facts.country_hits), facts.length)
+
+def relevance_scores(feats: List[Tuple[int, int, int, int]]) -> List[float]:
+    # All pages are scored in one go from their feature rows, so reweighting
+    # only means touching SCORE_WEIGHTS / LONG_PAGE_BONUS.
+    wt, wy, wc = SCORE_WEIGHTS
+    return [
+        wt * t + wy * y + wc * c + (LONG_PAGE_BONUS if n > LONG_PAGE else 0.0)
+        for t, y, c, n in feats
+    ]
+
+@dataclass(slots=True)
+class Record:
+    """One crawl result; the fields are the output columns, in order."""
+    title: str
+    url: str
+    source: str
+    score: float
+    pub_date: Optional[str]
+    years_found: List[int]
+    country_hits: List[str]
+    snippet: str
+
+    def __iter__(self):
+        # values in field order, i.e. one CSV row
+        return iter(_record_values(self))
+
+RECORD_FIELDS = [f.name for f in fields(Record)]
+_record_values = attrgetter(*RECORD_FIELDS)
+
+def crawl_topic_ddg(topic: str, year: str = "any", country: str = "worldwide", max_urls: int = 25, market_hint: str = "en-GB", use_cache: bool = True) -> List[Record]:
     # Build query for DDG
     q_parts = [topic]
     if year and year.lower() != "any":
@@ -176,62 +665,98 @@ def crawl_topic_ddg(topic: str, year: str = "any", country: str = "worldwide", m
     # Parse year range
     years = None
     if year and year.lower() != "any":
-        m = re.match(r"^(20\d{2})(?:\s*-\s*(20\d{2}))?$", year.strip())
+        m = _YEAR_SPEC_RE.match(year.strip())
         if m:
             y1, y2 = int(m.group(1)), int(m.group(2) or m.group(1))
             years = list(range(y1, y2 + 1))
 
-    topic_terms = re.findall(r"[A-Za-z0-9\-]+", topic)
+    topic_terms = _TOKEN_RE.findall(topic)
     use_country = None if country.lower() == "worldwide" else country
+    country_terms = country_keys(use_country)
 
     out = []
     seen_url = set()
 
+    host_count = Counter()
+
+    jobs = []
     for item in seeds:
-        url = item["url"]
-        key = jhash(url)
+        # fetch and report the real target, not a DDG redirect link;
+        # a malformed result link only costs its own seed
+        try:
+            item = {**item, "url": unwrap_url(item["url"])}
+            key = jhash(canon(item["url"]))
+            host = url_host(item["url"])
+        except ValueError:
+            continue
         if key in seen_url:
             continue
         seen_url.add(key)
-
-        html = fetch_html(url)
-        if not html:
+        if is_blocked(host):
             continue
-        text = clean_text(html)
-        if len(text) < 300:
+        reg = host_parts(host)[2] or host
+        if host_count[reg] >= MAX_PER_HOST:
             continue
+        host_count[reg] += 1
+        jobs.append(item)
 
-        score = relevance_score(text, topic_terms, years, use_country)
-        if score < 1.0:
+    # Fetch concurrently, then parse and analyse across all cores
+    cache = None
+    if use_cache:
+        try:
+            cache = PageCache()
+        except (OSError, sqlite3.Error):
+            cache = None  # unwritable cache dir: just fetch everything
+    try:
+        htmls = asyncio.run(fetch_all([it["url"] for it in jobs], cache))
+    finally:
+        if cache:
+            cache.close()
+    fetched = [(item, html) for item, html in zip(jobs, htmls) if html]
+    accepted = []
+    if fetched:
+        workers = min(os.cpu_count() or 1, len(fetched))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(topic_terms, country_terms)) as pex:
+            analysed = pex.map(_worker, [html for _, html in fetched], chunksize=4)
+            pages = [(item, res[0], res[1]) for (item, _), res in zip(fetched, analysed) if res]
+
+            # Score every page at once, then finish only those that clear MIN_SCORE
+            scores = relevance_scores([page_features(facts, years) for _, facts, _ in pages])
+            kept = [(item, facts, text, score) for (item, facts, text), score in zip(pages, scores) if score >= MIN_SCORE]
+            finished = pex.map(finish_page, [f for _, f, _, _ in kept], [t for _, _, t, _ in kept], chunksize=4)
+            accepted = [(item, facts, score) for (item, _, _, score), facts in zip(kept, finished)]
+
+    for item, facts, score in accepted:
+        url = item["url"]
+        domain, suffix, _ = host_parts(url_host(url))
+        source = ".".join([p for p in [domain, suffix] if p])
+
+        rec = Record(
+            title=item["title"],
+            url=url,
+            source=source,
+            score=round(score, 2),
+            pub_date=facts.pub_date,
+            years_found=facts.years,
+            country_hits=facts.country_hits,
+            snippet=item.get("snippet") or facts.lead,
+        )
+        out.append((facts.simhash, rec))
+
+    # Drop near-duplicate pages (syndicated copies), keeping the best-scored.
+    # Split each hash into 4 16-bit bands: two hashes within
+    # SIMHASH_MAX_DIST bits must agree on at least one band, so only pages
+    # sharing a band need comparing.
+    buckets: Dict[tuple, List[int]] = {}
+    dedup = []
+    for sh, r in sorted(out, key=lambda x: x[1].score, reverse=True):
+        bands = [(b, (sh >> (16 * b)) & 0xFFFF) for b in range(4)]
+        if any((sh ^ other).bit_count() <= SIMHASH_MAX_DIST for k in bands for other in buckets.get(k, ())):
             continue
-
-        years_found = extract_years(text)
-        country_hits = find_country_hits(text, use_country)
-        pub_date = guess_published(text)
-
-        ext = tldextract.extract(url)
-        source = ".".join([p for p in [ext.domain, ext.suffix] if p])
-
-        rec = {
-            "title": item["title"],
-            "url": url,
-            "source": source,
-            "score": round(score, 2),
-            "pub_date": pub_date,
-            "years_found": years_found,
-            "country_hits": country_hits,
-            "snippet": item.get("snippet") or summarize_lead(text, 400),
-        }
-        out.append(rec)
-        time.sleep(0.7 + random.random() * 0.4)  # polite delay
-
-    # Deduplicate by normalized title
-    dedup = {}
-    for r in sorted(out, key=lambda x: x["score"], reverse=True):
-        th = jhash((r["title"] or "").lower())
-        if th not in dedup:
-            dedup[th] = r
-    return list(dedup.values())
+        for k in bands:
+            buckets.setdefault(k, []).append(sh)
+        dedup.append(r)
+    return dedup
 
 # ---------------- CLI ----------------
 
@@ -243,10 +768,11 @@ def main():
     ap.add_argument("--country", default="worldwide", help="e.g., 'United Kingdom' or 'worldwide'")
     ap.add_argument("--max", type=int, default=25, help="max URLs to fetch (default 25)")
     ap.add_argument("--out", default="results.json", help="output file (.json or .csv)")
+    ap.add_argument("--no-cache", action="store_true", help="ignore the on-disk page cache")
     args = ap.parse_args()
 
     try:
-        records = crawl_topic_ddg(args.topic, args.year, args.country, args.max)
+        records = crawl_topic_ddg(args.topic, args.year, args.country, args.max, use_cache=not args.no_cache)
     except requests.HTTPError as e:
         print("HTTP error:", e)
         return
@@ -260,12 +786,13 @@ def main():
 
     if args.out.lower().endswith(".csv"):
         with open(args.out, "w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=records[0].keys())
-            w.writeheader()
+            w = csv.writer(f)
+            w.writerow(RECORD_FIELDS)
             w.writerows(records)
     else:
-        with open(args.out, "w", encoding="utf-8") as f:
-            json.dump(records, f, ensure_ascii=False, indent=2)
+        # orjson serialises dataclasses natively, in field order
+        with open(args.out, "wb") as f:
+            f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
 
     print(f"Saved {len(records)} records to {args.out}")
 